@@ -0,0 +1,104 @@
+"""
+Optional Numba-accelerated kernels.
+
+Numba is not a hard dependency: when it isn't installed, HAVE_NUMBA is
+False and callers fall back to the plain NumPy implementations in
+page_builder.
+"""
+
+import numpy as np
+
+try:
+    import numba
+
+    HAVE_NUMBA = True
+except ImportError:
+    numba = None
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    @numba.njit(cache=True, nogil=True)
+    def card_positions(
+        grid_rows, grid_cols, card_width_px, card_height_px, spacing_px, start_x, start_y
+    ):
+        """
+        Compute every card's top-left corner for a grid layout as an
+        (N, 2) int32 array in row-major order.
+        """
+        out = np.empty((grid_rows * grid_cols, 2), dtype=np.int32)
+        step_x = card_width_px + spacing_px
+        step_y = card_height_px + spacing_px
+        for row in range(grid_rows):
+            for col in range(grid_cols):
+                i = row * grid_cols + col
+                out[i, 0] = start_x + col * step_x
+                out[i, 1] = start_y + row * step_y
+        return out
+
+    @numba.njit(cache=True, parallel=True)
+    def stamp_marks(
+        arr,
+        xs,
+        ys,
+        card_width_px,
+        card_height_px,
+        mark_length,
+        mark_width,
+        red,
+        green,
+        blue,
+    ):
+        """
+        Write cut-mark crosses at all 4 corners of every card in one
+        JIT-compiled loop over the canvas array.
+
+        xs/ys hold each card's top-left corner; cards are independent,
+        so prange parallelizes across them.
+        """
+        height = arr.shape[0]
+        width = arr.shape[1]
+        half = mark_width // 2
+        rest = mark_width - half
+
+        for i in numba.prange(xs.shape[0]):
+            for corner in range(4):
+                cx = xs[i] + (corner % 2) * card_width_px
+                cy = ys[i] + (corner // 2) * card_height_px
+
+                # Horizontal bar
+                for yy in range(max(cy - half, 0), min(cy + rest, height)):
+                    for xx in range(
+                        max(cx - mark_length, 0), min(cx + mark_length, width)
+                    ):
+                        arr[yy, xx, 0] = red
+                        arr[yy, xx, 1] = green
+                        arr[yy, xx, 2] = blue
+
+                # Vertical bar
+                for yy in range(
+                    max(cy - mark_length, 0), min(cy + mark_length, height)
+                ):
+                    for xx in range(max(cx - half, 0), min(cx + rest, width)):
+                        arr[yy, xx, 0] = red
+                        arr[yy, xx, 1] = green
+                        arr[yy, xx, 2] = blue
+
+else:
+    stamp_marks = None
+
+    def card_positions(
+        grid_rows, grid_cols, card_width_px, card_height_px, spacing_px, start_x, start_y
+    ):
+        """Vectorized fallback for the grid-position kernel."""
+        xs = start_x + np.arange(grid_cols, dtype=np.int32) * (
+            card_width_px + spacing_px
+        )
+        ys = start_y + np.arange(grid_rows, dtype=np.int32) * (
+            card_height_px + spacing_px
+        )
+        out = np.empty((grid_rows * grid_cols, 2), dtype=np.int32)
+        out[:, 0] = np.tile(xs, grid_rows)
+        out[:, 1] = np.repeat(ys, grid_cols)
+        return out
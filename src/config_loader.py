@@ -4,10 +4,23 @@ Configuration loader module.
 Handles loading and parsing configuration files.
 """
 
+import ast
 import os
+import re
 import shutil
 import sys
 
+# Matches one "KEY = value" line, skipping comment-only lines and
+# stripping trailing inline comments and whitespace in the C regex engine
+_KV = re.compile(
+    r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*([^\n#]*?)[ \t]*(?:#.*)?$",
+    re.M,
+)
+
+# Parsed configs keyed by (absolute path, mtime_ns) so repeated calls in
+# batch runs skip the re-read and re-parse; a changed file gets a new key
+_CONFIG_CACHE = {}
+
 
 def load_config(config_file):
     """
@@ -44,26 +57,30 @@ def load_config(config_file):
             )
             sys.exit(1)
 
-    config = {}
+    # Serve from cache when the file hasn't changed since it was parsed;
+    # return a copy so callers can't mutate the cached dict
+    cache_key = (os.path.abspath(config_file), os.stat(config_file).st_mtime_ns)
+    if cache_key in _CONFIG_CACHE:
+        return dict(_CONFIG_CACHE[cache_key])
+
     with open(config_file, "r") as f:
-        for line in f:
-            line = line.strip()
-            # Skip comments and empty lines
-            if not line or line.startswith("#"):
-                continue
-            # Parse key = value
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
+        text = f.read()
+
+    config = {}
+    for match in _KV.finditer(text):
+        key, value = match.group(1), match.group(2)
+
+        # Convert to appropriate type
+        if value.lower() in ("true", "false"):
+            config[key] = value.lower() == "true"
+        else:
+            try:
+                # Handles ints, floats and negatives correctly (the old
+                # isdigit() check misread values like -1.5.0 as numbers)
+                config[key] = ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                # String
+                config[key] = value
 
-                # Convert to appropriate type
-                if value.lower() in ("true", "false"):
-                    config[key] = value.lower() == "true"
-                elif value.replace(".", "", 1).replace("-", "", 1).isdigit():
-                    # Number (int or float)
-                    config[key] = float(value) if "." in value else int(value)
-                else:
-                    # String
-                    config[key] = value
-    return config
+    _CONFIG_CACHE[cache_key] = config
+    return dict(config)
@@ -4,12 +4,131 @@ Sheet generator module.
 Main logic for generating complete card sheets with multiple pages.
 """
 
+import gc
+import hashlib
+import io
+import json
 import os
+import pickle
+import queue
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+
 from .config_loader import load_config
 from .page_builder import create_single_page
 
+# Optional: img2pdf embeds the per-page JPEGs verbatim instead of going
+# through Pillow's PDF writer, which re-encodes on append
+try:
+    import img2pdf
+except ImportError:
+    img2pdf = None
+
+
+@dataclass(frozen=True)
+class SheetLayout:
+    """
+    Pixel-space layout derived once from a config.
+
+    Every value here is a pure function of the config, so it is computed
+    up front and carried as one object instead of a dozen positional
+    arguments - and it pickles cheaply into the page render workers.
+    """
+
+    paper_width_mm: float
+    paper_height_mm: float
+    orientation: str
+    dpi: int
+    mm_to_pixels: float
+    paper_width_px: int
+    paper_height_px: int
+    card_width_mm: float
+    card_height_mm: float
+    card_width_px: int
+    card_height_px: int
+    gap_mm: float
+    spacing_px: int
+    grid_cols: int
+    grid_rows: int
+    cards_per_page: int
+    start_x: int
+    start_y: int
+    paper_width_in: float
+    paper_height_in: float
+    card_width_in: float
+    card_height_in: float
+
+    @classmethod
+    def from_config(cls, config):
+        """Compute the full pixel layout from raw config values."""
+        # Paper dimensions - apply orientation
+        base_width_mm = config["PAPER_WIDTH_MM"]
+        base_height_mm = config["PAPER_HEIGHT_MM"]
+        orientation = config.get("PAPER_ORIENTATION", "landscape").lower()
+
+        if orientation == "portrait":
+            # Portrait: taller than wide
+            paper_width_mm = min(base_width_mm, base_height_mm)
+            paper_height_mm = max(base_width_mm, base_height_mm)
+        else:
+            # Landscape: wider than tall
+            paper_width_mm = max(base_width_mm, base_height_mm)
+            paper_height_mm = min(base_width_mm, base_height_mm)
+
+        dpi = config["DPI"]
+        mm_to_pixels = dpi / 25.4
+
+        card_width_mm = config["CARD_WIDTH_MM"]
+        card_height_mm = config["CARD_HEIGHT_MM"]
+        card_width_px = int(card_width_mm * mm_to_pixels)
+        card_height_px = int(card_height_mm * mm_to_pixels)
+
+        gap_mm = config["GAP_MM"]
+        spacing_px = int(gap_mm * mm_to_pixels)
+
+        grid_cols = config["GRID_COLS"]
+        grid_rows = config["GRID_ROWS"]
+
+        paper_width_px = int(paper_width_mm * mm_to_pixels)
+        paper_height_px = int(paper_height_mm * mm_to_pixels)
+
+        # Center the grid on the page
+        total_grid_width = (card_width_px * grid_cols) + (
+            spacing_px * (grid_cols - 1)
+        )
+        total_grid_height = (card_height_px * grid_rows) + (
+            spacing_px * (grid_rows - 1)
+        )
+
+        return cls(
+            paper_width_mm=paper_width_mm,
+            paper_height_mm=paper_height_mm,
+            orientation=orientation,
+            dpi=dpi,
+            mm_to_pixels=mm_to_pixels,
+            paper_width_px=paper_width_px,
+            paper_height_px=paper_height_px,
+            card_width_mm=card_width_mm,
+            card_height_mm=card_height_mm,
+            card_width_px=card_width_px,
+            card_height_px=card_height_px,
+            gap_mm=gap_mm,
+            spacing_px=spacing_px,
+            grid_cols=grid_cols,
+            grid_rows=grid_rows,
+            cards_per_page=grid_cols * grid_rows,
+            start_x=(paper_width_px - total_grid_width) // 2,
+            start_y=(paper_height_px - total_grid_height) // 2,
+            paper_width_in=paper_width_mm / 25.4,
+            paper_height_in=paper_height_mm / 25.4,
+            card_width_in=card_width_mm / 25.4,
+            card_height_in=card_height_mm / 25.4,
+        )
+
 
 def generate_sheets(config_file="config/current.conf"):
     """
@@ -21,48 +140,9 @@ def generate_sheets(config_file="config/current.conf"):
         config_file: Path to configuration file (default: config/current.conf)
     """
 
-    # Load configuration
+    # Load configuration and derive the pixel layout once
     config = load_config(config_file)
-
-    # Paper dimensions - apply orientation
-    base_width_mm = config["PAPER_WIDTH_MM"]
-    base_height_mm = config["PAPER_HEIGHT_MM"]
-    orientation = config.get("PAPER_ORIENTATION", "landscape").lower()
-
-    # Swap dimensions if portrait orientation
-    if orientation == "portrait":
-        # Swap to portrait (taller than wide)
-        if base_width_mm > base_height_mm:
-            paper_width_mm = base_height_mm
-            paper_height_mm = base_width_mm
-        else:
-            paper_width_mm = base_width_mm
-            paper_height_mm = base_height_mm
-    else:  # landscape
-        # Swap to landscape (wider than tall)
-        if base_width_mm < base_height_mm:
-            paper_width_mm = base_height_mm
-            paper_height_mm = base_width_mm
-        else:
-            paper_width_mm = base_width_mm
-            paper_height_mm = base_height_mm
-
-    dpi = config["DPI"]
-
-    # Convert mm to pixels
-    mm_to_pixels = dpi / 25.4
-    paper_width_px = int(paper_width_mm * mm_to_pixels)
-    paper_height_px = int(paper_height_mm * mm_to_pixels)
-
-    # Card dimensions
-    card_width_mm = config["CARD_WIDTH_MM"]
-    card_height_mm = config["CARD_HEIGHT_MM"]
-    card_width_px = int(card_width_mm * mm_to_pixels)
-    card_height_px = int(card_height_mm * mm_to_pixels)
-
-    # Gap between cards
-    gap_mm = config["GAP_MM"]
-    spacing_px = int(gap_mm * mm_to_pixels)
+    layout = SheetLayout.from_config(config)
 
     # Input/Output
     image_folder = config["CARD_IMAGES_FOLDER"]
@@ -85,107 +165,184 @@ def generate_sheets(config_file="config/current.conf"):
         print(f"   Supported formats: PNG, JPG, JPEG, WEBP, BMP")
         return
 
-    # Grid configuration
-    grid_cols = config["GRID_COLS"]
-    grid_rows = config["GRID_ROWS"]
-    cards_per_page = grid_cols * grid_rows
-
     # Validate that the grid fits on the page
     _validate_grid_fits(
-        paper_width_mm,
-        paper_height_mm,
-        card_width_mm,
-        card_height_mm,
-        gap_mm,
-        grid_cols,
-        grid_rows,
-        orientation,
+        layout.paper_width_mm,
+        layout.paper_height_mm,
+        layout.card_width_mm,
+        layout.card_height_mm,
+        layout.gap_mm,
+        layout.grid_cols,
+        layout.grid_rows,
+        layout.orientation,
     )
 
     # Calculate how many pages we need
+    cards_per_page = layout.cards_per_page
     total_pages = (len(image_files) + cards_per_page - 1) // cards_per_page
 
     # Print summary
-    _print_summary(
-        image_files,
-        paper_width_mm,
-        paper_height_mm,
-        card_width_mm,
-        card_height_mm,
-        gap_mm,
-        dpi,
-        cards_per_page,
-        grid_cols,
-        grid_rows,
-        total_pages,
-        orientation,
-    )
-
-    # Calculate starting position to center the grid
-    total_grid_width = (card_width_px * grid_cols) + (spacing_px * (grid_cols - 1))
-    total_grid_height = (card_height_px * grid_rows) + (spacing_px * (grid_rows - 1))
-
-    start_x = (paper_width_px - total_grid_width) // 2
-    start_y = (paper_height_px - total_grid_height) // 2
+    _print_summary(image_files, total_pages, layout)
 
-    # Split cards into pages
-    pages = []
+    # Split cards into pages; each page only needs file paths, the config
+    # and the layout object, so the worker arguments stay cheap to pickle
+    page_args = []
     for page_num in range(total_pages):
         start_idx = page_num * cards_per_page
         end_idx = min(start_idx + cards_per_page, len(image_files))
         page_cards = image_files[start_idx:end_idx]
 
-        canvas = create_single_page(
-            page_cards,
-            page_num + 1,
-            total_pages,
-            config,
-            card_width_px,
-            card_height_px,
-            spacing_px,
-            paper_width_px,
-            paper_height_px,
-            start_x,
-            start_y,
-            mm_to_pixels,
-        )
-        pages.append(canvas)
+        page_args.append((page_cards, page_num + 1, total_pages, config, layout))
+
+    # Render pages in parallel - pages share no state, so a process pool
+    # sidesteps the GIL for the Python-level compositing. Pages are
+    # yielded in order, one at a time, so the saver never holds the
+    # whole job's rasters in memory at once. Single-page jobs skip the
+    # pool overhead.
+    def _page_iter():
+        if total_pages > 1:
+            # cpu_count() can return None on exotic platforms
+            max_workers = min(
+                total_pages, config.get("MAX_WORKERS", 0) or os.cpu_count() or 1
+            )
+            # Keep only a bounded window of pages in flight. That gives
+            # the pipeline backpressure: decode (worker thread pools),
+            # compose (worker processes) and save (this thread) overlap,
+            # but composition can run ahead of the saver by at most
+            # window pages, capping peak memory. executor.map would
+            # buffer every finished page if saving fell behind.
+            window = max_workers + 2
+            pending = deque()
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for args in page_args:
+                    pending.append(executor.submit(_render_page, args))
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+        else:
+            for args in page_args:
+                yield _render_page(args)
+
+    # Optional composed-page cache: when only save-side settings change
+    # between runs (output format, PNG compression), the rendered pages
+    # are reloaded from disk instead of recomposed. Off by default
+    # because it holds and pickles every page, trading the streaming
+    # one-page working set for fast format-only reruns.
+    pages = _page_iter()
+    cache_file = ""
+    if config.get("CANVAS_CACHE_ENABLED", False):
+        cache_dir = os.path.join(output_dir, ".canvas_cache")
+        sig = _canvas_cache_sig(config, image_files)
+        cache_file = os.path.join(cache_dir, f"{sig}.pkl")
+        if os.path.exists(cache_file):
+            print(f"✓ Reusing composed pages from cache")
+            # Touch the entry so pruning keeps recently used signatures
+            os.utime(cache_file)
+            with open(cache_file, "rb") as f:
+                pages = pickle.load(f)
+        else:
+            pages = list(pages)
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_file, "wb") as f:
+                pickle.dump(pages, f, protocol=pickle.HIGHEST_PROTOCOL)
+            _prune_canvas_cache(cache_dir)
 
     # Save the result(s)
-    _save_pages(pages, output_path, output_dir, dpi)
+    _save_pages(
+        pages,
+        total_pages,
+        output_path,
+        output_dir,
+        layout.dpi,
+        config.get("PNG_COMPRESS_LEVEL", 1),
+    )
 
     # Print final summary
-    _print_final_summary(
-        config,
-        paper_width_mm,
-        paper_height_mm,
-        grid_cols,
-        grid_rows,
-        cards_per_page,
-        dpi,
-        paper_width_px,
-        paper_height_px,
-        image_files,
-        total_pages,
-        card_width_mm,
-        card_height_mm,
-        card_width_px,
-        card_height_px,
-        gap_mm,
-        start_x,
-        start_y,
-        mm_to_pixels,
-        orientation,
+    _print_final_summary(config, image_files, total_pages, layout)
+
+
+def _render_page(args):
+    """Unpack one page's arguments and render it (process pool target)."""
+    return create_single_page(*args)
+
+
+# Config keys that affect the rendered pixels; output filename and
+# format-only settings are deliberately excluded so a format switch
+# still hits the canvas cache
+_CANVAS_CACHE_KEYS = (
+    "PAPER_WIDTH_MM",
+    "PAPER_HEIGHT_MM",
+    "PAPER_ORIENTATION",
+    "DPI",
+    "CARD_WIDTH_MM",
+    "CARD_HEIGHT_MM",
+    "GAP_MM",
+    "GRID_COLS",
+    "GRID_ROWS",
+    "MARK_LENGTH_MM",
+    "MARK_WIDTH_PX",
+    "MARK_COLOR_R",
+    "MARK_COLOR_G",
+    "MARK_COLOR_B",
+    "GUIDE_LINE_ENABLED",
+    "GUIDE_LINE_COLOR_R",
+    "GUIDE_LINE_COLOR_G",
+    "GUIDE_LINE_COLOR_B",
+    "GUIDE_LINE_WIDTH_PX",
+    "FAST_DOWNSCALE",
+)
+
+
+def _canvas_cache_sig(config, image_files):
+    """Hash of everything that determines the composed pages."""
+    layout_part = json.dumps(
+        {key: config.get(key) for key in _CANVAS_CACHE_KEYS}, sort_keys=True
+    ).encode()
+    files_part = b"".join(
+        f"{path}:{os.stat(path).st_mtime_ns}".encode() for path in image_files
     )
+    return hashlib.blake2b(layout_part + files_part, digest_size=16).hexdigest()
+
+
+# Cached page sets kept before LRU pruning kicks in; each entry holds a
+# whole job's pages as raw bitmaps, so the cap stays small
+_CANVAS_CACHE_LIMIT = 4
+
+
+def _prune_canvas_cache(cache_dir, limit=_CANVAS_CACHE_LIMIT):
+    """Drop least-recently-used page sets once the cache exceeds the limit."""
+    with os.scandir(cache_dir) as it:
+        entries = [e for e in it if e.name.endswith(".pkl")]
+    if len(entries) <= limit:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[: len(entries) - limit]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+# Supported card image extensions
+_IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".bmp"})
 
 
 def _get_image_files(image_folder):
     """Get all image files from folder."""
-    image_files = []
-    for file in sorted(os.listdir(image_folder)):
-        if file.lower().endswith((".png", ".jpg", ".jpeg", ".webp", ".bmp")):
-            image_files.append(os.path.join(image_folder, file))
-    return image_files
+    # scandir yields pre-joined paths and cached file-type info, avoiding
+    # the extra stat and join per entry that listdir implies
+    with os.scandir(image_folder) as it:
+        entries = [
+            entry
+            for entry in it
+            if entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTS
+        ]
+    # Sort on the bare names (same order as the full paths, which only
+    # differ by a shared folder prefix) so the comparisons stay short
+    entries.sort(key=lambda entry: entry.name)
+    return [entry.path for entry in entries]
 
 
 def _validate_grid_fits(
@@ -257,164 +414,202 @@ def _validate_grid_fits(
         sys.exit(1)
 
 
-def _print_summary(
-    image_files,
-    paper_width_mm,
-    paper_height_mm,
-    card_width_mm,
-    card_height_mm,
-    gap_mm,
-    dpi,
-    cards_per_page,
-    grid_cols,
-    grid_rows,
-    total_pages,
-    orientation,
-):
+def _print_summary(image_files, total_pages, layout):
     """Print initial summary of configuration."""
-    paper_width_inches = paper_width_mm / 25.4
-    paper_height_inches = paper_height_mm / 25.4
-    card_width_inches = card_width_mm / 25.4
-    card_height_inches = card_height_mm / 25.4
-
-    print(f"{'='*60}")
-    print(f"CARD SHEET GENERATOR")
-    print(f"{'='*60}")
-    print(f"✓ Found {len(image_files)} card images")
-    print(
-        f"✓ Paper: {paper_width_mm}mm × {paper_height_mm}mm ({paper_width_inches:.1f}\" × {paper_height_inches:.1f}\")"
-    )
-    print(f"✓ Orientation: {orientation.upper()}")
-    print(
-        f"✓ Card size: {card_width_mm}mm × {card_height_mm}mm ({card_width_inches:.2f}\" × {card_height_inches:.2f}\")"
-    )
-    print(f"✓ Gap between cards: {gap_mm}mm")
-    print(f"✓ Resolution: {dpi} DPI")
-    print(f"✓ Cards per page: {cards_per_page} ({grid_cols} × {grid_rows})")
-    print(f"✓ Total pages needed: {total_pages}")
-
+    # Built as one string and written in one call; per-line print()s each
+    # take the stdout lock and flush, which adds up on batch runs
+    lines = [
+        f"{'='*60}",
+        f"CARD SHEET GENERATOR",
+        f"{'='*60}",
+        f"✓ Found {len(image_files)} card images",
+        f"✓ Paper: {layout.paper_width_mm}mm × {layout.paper_height_mm}mm "
+        f"({layout.paper_width_in:.1f}\" × {layout.paper_height_in:.1f}\")",
+        f"✓ Orientation: {layout.orientation.upper()}",
+        f"✓ Card size: {layout.card_width_mm}mm × {layout.card_height_mm}mm "
+        f"({layout.card_width_in:.2f}\" × {layout.card_height_in:.2f}\")",
+        f"✓ Gap between cards: {layout.gap_mm}mm",
+        f"✓ Resolution: {layout.dpi} DPI",
+        f"✓ Cards per page: {layout.cards_per_page} "
+        f"({layout.grid_cols} × {layout.grid_rows})",
+        f"✓ Total pages needed: {total_pages}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _save_pages(pages, total_pages, output_path, output_dir, dpi, png_compress_level=1):
+    """
+    Save pages as PDF or PNG files.
 
-def _save_pages(pages, output_path, output_dir, dpi):
-    """Save pages as PDF or PNG files."""
+    pages is an iterable consumed one page at a time, so peak memory
+    stays at a single rendered page regardless of job size.
+    """
     print(f"\n{'='*60}")
     print(f"SAVING FILES...")
     print(f"{'='*60}")
 
     if output_path.lower().endswith(".pdf"):
-        # Save as multi-page PDF
-        if len(pages) == 1:
-            pages[0].save(output_path, "PDF", resolution=dpi, quality=100)
-            print(f"✓ Created: {output_path} (1 page)")
-        else:
-            # First page as base, rest as append
-            pages[0].save(
-                output_path,
-                "PDF",
-                resolution=dpi,
-                quality=100,
-                save_all=True,
-                append_images=pages[1:],
-            )
-            print(f"✓ Created: {output_path} ({len(pages)} pages)")
+        # Save as multi-page PDF - first page creates the file, each
+        # following page is appended so nothing accumulates in memory.
+        # The encode runs on a background thread fed through a small
+        # bounded queue, so composing page N+1 overlaps encoding page N
+        # while at most a few finished pages sit in the queue.
+        encode_q = queue.Queue(maxsize=3)
+        errors = []
+        # With img2pdf the worker only JPEG-encodes each page; the final
+        # PDF is assembled once at the end from the compressed blobs
+        # (a few MB each) with no second pixel pass
+        jpeg_pages = []
+
+        def _encode_worker():
+            i = 0
+            while True:
+                page = encode_q.get()
+                if page is None:
+                    return
+                if not errors:
+                    try:
+                        if img2pdf is not None:
+                            buf = io.BytesIO()
+                            page.save(buf, "JPEG", quality=100, dpi=(dpi, dpi))
+                            jpeg_pages.append(buf.getvalue())
+                        else:
+                            page.save(
+                                output_path,
+                                "PDF",
+                                resolution=dpi,
+                                quality=100,
+                                append=(i > 0),
+                            )
+                    except Exception as e:
+                        # Remember the failure but keep draining so the
+                        # producer never blocks on a full queue
+                        errors.append(e)
+                # Release the ~100 MB pixel buffer now rather than
+                # whenever the GC gets around to it
+                page.close()
+                i += 1
+
+        worker = threading.Thread(target=_encode_worker, name="pdf-encode")
+        worker.start()
+        try:
+            for page in pages:
+                encode_q.put(page)
+        finally:
+            encode_q.put(None)
+            worker.join()
+        if errors:
+            raise errors[0]
+        if img2pdf is not None:
+            layout_fun = img2pdf.get_fixed_dpi_layout_fun((dpi, dpi))
+            with open(output_path, "wb") as f:
+                f.write(img2pdf.convert(jpeg_pages, layout_fun=layout_fun))
+        if total_pages > 1:
+            # Hand the encoder's scratch buffers back to the allocator
+            # before the process moves on (matters for batch callers)
+            gc.collect()
+        print(
+            f"✓ Created: {output_path} "
+            f"({total_pages} page{'s' if total_pages > 1 else ''})"
+        )
     else:
-        # Save as multiple PNG files with suffixes
+        # Save as PNG; multiple pages get _1, _2, ... suffixes
         base_name = os.path.splitext(output_path)[0]
         ext = os.path.splitext(output_path)[1]
 
-        if len(pages) == 1:
+        if total_pages == 1:
             # Single page - no suffix needed
-            pages[0].save(
-                output_path, "PNG", dpi=(dpi, dpi), optimize=False, compress_level=0
-            )
-            print(f"✓ Created: {output_path}")
+            for page in pages:
+                _save_png(page, output_path, dpi, png_compress_level)
+                print(f"✓ Created: {output_path}")
         else:
-            # Multiple pages - add suffixes
-            for i, page in enumerate(pages):
-                filename = f"{base_name}_{i+1}{ext}"
-                page.save(
-                    filename, "PNG", dpi=(dpi, dpi), optimize=False, compress_level=0
-                )
-                print(f"✓ Created: {filename}")
+            # Each PNG encode is seconds of zlib work with the GIL
+            # released, so page files are written concurrently; a
+            # bounded window keeps at most a few encoding pages alive
+            max_workers = min(total_pages, os.cpu_count() or 1)
+            pending = deque()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for i, page in enumerate(pages):
+                    filename = f"{base_name}_{i+1}{ext}"
+                    pending.append(
+                        (
+                            filename,
+                            executor.submit(
+                                _save_png, page, filename, dpi, png_compress_level
+                            ),
+                        )
+                    )
+                    if len(pending) >= max_workers * 2:
+                        filename, future = pending.popleft()
+                        future.result()
+                        print(f"✓ Created: {filename}")
+                while pending:
+                    filename, future = pending.popleft()
+                    future.result()
+                    print(f"✓ Created: {filename}")
+
+
+def _save_png(page, filename, dpi, compress_level):
+    """
+    Encode one page to PNG.
+
+    Single chokepoint for PNG writes (the dpi metadata here is what
+    makes actual-size printing work), and the level-1 default keeps the
+    deflate cost near zero while still shrinking files 5-10x vs raw.
+    The page is closed after the write - each caller is done with it.
+    """
+    page.save(filename, "PNG", dpi=(dpi, dpi), compress_level=compress_level)
+    page.close()
 
 
-def _print_final_summary(
-    config,
-    paper_width_mm,
-    paper_height_mm,
-    grid_cols,
-    grid_rows,
-    cards_per_page,
-    dpi,
-    paper_width_px,
-    paper_height_px,
-    image_files,
-    total_pages,
-    card_width_mm,
-    card_height_mm,
-    card_width_px,
-    card_height_px,
-    gap_mm,
-    start_x,
-    start_y,
-    mm_to_pixels,
-    orientation,
-):
+def _print_final_summary(config, image_files, total_pages, layout):
     """Print final summary with print settings."""
-    paper_width_inches = paper_width_mm / 25.4
-    paper_height_inches = paper_height_mm / 25.4
-    card_width_inches = card_width_mm / 25.4
-    card_height_inches = card_height_mm / 25.4
-
-    print(f"\n{'='*60}")
-    print(f"✓ SUCCESS!")
-    print(f"{'='*60}")
-    print(
-        f"  Paper: {paper_width_mm}mm × {paper_height_mm}mm ({paper_width_inches:.1f}\" × {paper_height_inches:.1f}\")"
-    )
-    print(
-        f"  Layout: {grid_cols} columns × {grid_rows} rows = {cards_per_page} cards per page"
-    )
-    print(f"  Resolution: {dpi} DPI")
-    print(f"  Image size: {paper_width_px} × {paper_height_px} pixels")
-    print(f"  Total cards: {len(image_files)}")
-    print(f"  Total pages: {total_pages}")
-    print(
-        f"  Card size: {card_width_mm}mm × {card_height_mm}mm ({card_width_px} × {card_height_px} pixels)"
-    )
-    print(f"  Gap between cards: {gap_mm}mm")
-    print(
-        f"  Cut marks: RGB({config['MARK_COLOR_R']},{config['MARK_COLOR_G']},{config['MARK_COLOR_B']})"
-    )
-    print(f"\n  Margins:")
-    print(f"    Left/Right: {start_x/mm_to_pixels:.1f}mm")
-    print(f"    Top/Bottom: {start_y/mm_to_pixels:.1f}mm")
-    print(f"\n{'='*60}")
-    print(f"📄 CRITICAL PRINT SETTINGS:")
-    print(f"{'='*60}")
-    print(
-        f"  ⚠️  Paper size: {paper_width_mm}mm × {paper_height_mm}mm ({paper_width_inches:.1f}\" × {paper_height_inches:.1f}\")"
-    )
-    print(f"  ⚠️  Orientation: {orientation.upper()}")
-    print(f"  ⚠️  Borderless printing: ENABLED")
-    print(f"  ⚠️  Scale: 100% - DO NOT SCALE OR 'FIT TO PAGE'")
-    print(f"  ⚠️  Quality: Best/Maximum/High")
-    print(f"  ⚠️  Color: Full Color")
-    print(f"  ⚠️  Page Scaling: None/Actual Size")
-    print(f"\n  In printer dialog:")
-    print(f"    • Paper: Check config for exact size")
-    print(f"    • Orientation: {orientation.upper()}")
-    print(f"    • Borderless: ON")
-    print(f"    • UNCHECK 'Fit to page'")
-    print(f"    • UNCHECK 'Shrink to fit'")
-    print(f"    • CHECK 'Actual size' or '100%'")
-    print(f"    • Set custom scale to: 100%")
-    print(
-        f"\n✂️  Cut along corner marks for exact {card_width_mm}mm × {card_height_mm}mm cards!"
-    )
-    print(f"\n📏 After printing, verify with ruler:")
-    print(
-        f"   Card width should be: {card_width_mm}mm ({card_width_inches:.2f} inches)"
-    )
-    print(
-        f"   Card height should be: {card_height_mm}mm ({card_height_inches:.2f} inches)"
-    )
+    # Same single-write pattern as _print_summary; the inch figures are
+    # precomputed on the layout rather than re-derived here
+    lines = [
+        f"\n{'='*60}",
+        f"✓ SUCCESS!",
+        f"{'='*60}",
+        f"  Paper: {layout.paper_width_mm}mm × {layout.paper_height_mm}mm "
+        f"({layout.paper_width_in:.1f}\" × {layout.paper_height_in:.1f}\")",
+        f"  Layout: {layout.grid_cols} columns × {layout.grid_rows} rows "
+        f"= {layout.cards_per_page} cards per page",
+        f"  Resolution: {layout.dpi} DPI",
+        f"  Image size: {layout.paper_width_px} × {layout.paper_height_px} pixels",
+        f"  Total cards: {len(image_files)}",
+        f"  Total pages: {total_pages}",
+        f"  Card size: {layout.card_width_mm}mm × {layout.card_height_mm}mm "
+        f"({layout.card_width_px} × {layout.card_height_px} pixels)",
+        f"  Gap between cards: {layout.gap_mm}mm",
+        f"  Cut marks: RGB({config['MARK_COLOR_R']},{config['MARK_COLOR_G']},{config['MARK_COLOR_B']})",
+        f"\n  Margins:",
+        f"    Left/Right: {layout.start_x/layout.mm_to_pixels:.1f}mm",
+        f"    Top/Bottom: {layout.start_y/layout.mm_to_pixels:.1f}mm",
+        f"\n{'='*60}",
+        f"📄 CRITICAL PRINT SETTINGS:",
+        f"{'='*60}",
+        f"  ⚠️  Paper size: {layout.paper_width_mm}mm × {layout.paper_height_mm}mm "
+        f"({layout.paper_width_in:.1f}\" × {layout.paper_height_in:.1f}\")",
+        f"  ⚠️  Orientation: {layout.orientation.upper()}",
+        f"  ⚠️  Borderless printing: ENABLED",
+        f"  ⚠️  Scale: 100% - DO NOT SCALE OR 'FIT TO PAGE'",
+        f"  ⚠️  Quality: Best/Maximum/High",
+        f"  ⚠️  Color: Full Color",
+        f"  ⚠️  Page Scaling: None/Actual Size",
+        f"\n  In printer dialog:",
+        f"    • Paper: Check config for exact size",
+        f"    • Orientation: {layout.orientation.upper()}",
+        f"    • Borderless: ON",
+        f"    • UNCHECK 'Fit to page'",
+        f"    • UNCHECK 'Shrink to fit'",
+        f"    • CHECK 'Actual size' or '100%'",
+        f"    • Set custom scale to: 100%",
+        f"\n✂️  Cut along corner marks for exact {layout.card_width_mm}mm × "
+        f"{layout.card_height_mm}mm cards!",
+        f"\n📏 After printing, verify with ruler:",
+        f"   Card width should be: {layout.card_width_mm}mm "
+        f"({layout.card_width_in:.2f} inches)",
+        f"   Card height should be: {layout.card_height_mm}mm "
+        f"({layout.card_height_in:.2f} inches)",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")